@@ -5,11 +5,27 @@ import { Pin } from "./Pin.js";
 let netSeq = 0;
 
 export class Circuit {
-  readonly components: Component[] = [];
-  readonly nets: Net[] = [];
+  private readonly _components: Component[] = [];
+  private readonly _nets: Net[] = [];
+  private _revision = 0;
+
+  /** Read-only views; wire through addComponent()/connect() so revision stays in step. */
+  get components(): readonly Component[] {
+    return this._components;
+  }
+
+  get nets(): readonly Net[] {
+    return this._nets;
+  }
+
+  /** Bumped on every wiring change, so derived tables (e.g. the Propagator's) know to rebuild. */
+  get revision(): number {
+    return this._revision;
+  }
 
   addComponent(c: Component): void {
-    this.components.push(c);
+    this._components.push(c);
+    this._revision++;
   }
 
   /** Connect one or more pins together onto a single shared net.
@@ -20,7 +36,7 @@ export class Circuit {
 
     if (net === null) {
       net = new Net(`net_${netSeq++}`);
-      this.nets.push(net);
+      this._nets.push(net);
     } else {
       // Merge any other nets the pins might already belong to
       for (const pin of pins) {
@@ -33,6 +49,7 @@ export class Circuit {
     for (const pin of pins) {
       pin.net = net;
     }
+    this._revision++;
 
     return net;
   }
@@ -40,7 +57,7 @@ export class Circuit {
   /** Merge srcNet into dstNet: migrate all driver entries and re-point all pins. */
   private _mergeNets(dstNet: Net, srcNet: Net): void {
     // Re-point every pin that referenced srcNet
-    for (const comp of this.components) {
+    for (const comp of this._components) {
       for (const pin of comp.pins) {
         if (pin.net === srcNet) {
           pin.net = dstNet;
@@ -49,7 +66,7 @@ export class Circuit {
     }
 
     // Remove srcNet from the nets list
-    const idx = this.nets.indexOf(srcNet);
-    if (idx !== -1) this.nets.splice(idx, 1);
+    const idx = this._nets.indexOf(srcNet);
+    if (idx !== -1) this._nets.splice(idx, 1);
   }
 }
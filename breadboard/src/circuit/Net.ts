@@ -3,46 +3,57 @@ import { NetState } from "./types.js";
 export class Net {
   readonly id: string;
   private drivers = new Map<string, NetState.HIGH | NetState.LOW>();
+  // Running tallies of the driver map, so resolution never walks the drivers
+  private highCount = 0;
+  private lowCount = 0;
 
   constructor(id: string) {
     this.id = id;
   }
 
   drive(driverId: string, state: NetState.HIGH | NetState.LOW): void {
+    const prev = this.drivers.get(driverId);
+    if (prev === state) return;
+    if (prev !== undefined) this._count(prev, -1);
     this.drivers.set(driverId, state);
+    this._count(state, 1);
   }
 
   unDrive(driverId: string): void {
+    const prev = this.drivers.get(driverId);
+    if (prev === undefined) return;
     this.drivers.delete(driverId);
+    this._count(prev, -1);
   }
 
   get resolvedState(): NetState {
-    return this._resolve(this.drivers);
+    return Net._resolve(this.highCount, this.lowCount);
   }
 
   /** Net state as seen from outside a specific driver (ignores that driver's contribution). */
   resolvedStateExcluding(driverId: string): NetState {
-    if (!this.drivers.has(driverId)) return this.resolvedState;
-    const temp = new Map(this.drivers);
-    temp.delete(driverId);
-    return this._resolve(temp);
+    const own = this.drivers.get(driverId);
+    if (own === undefined) return this.resolvedState;
+    return own === NetState.HIGH
+      ? Net._resolve(this.highCount - 1, this.lowCount)
+      : Net._resolve(this.highCount, this.lowCount - 1);
   }
 
-  private _resolve(drivers: Map<string, NetState.HIGH | NetState.LOW>): NetState {
-    if (drivers.size === 0) return NetState.FLOAT;
-    let hasHigh = false;
-    let hasLow = false;
-    for (const state of drivers.values()) {
-      if (state === NetState.HIGH) hasHigh = true;
-      else hasLow = true;
-    }
-    if (hasHigh && hasLow) return NetState.CONFLICT;
-    if (hasHigh) return NetState.HIGH;
-    return NetState.LOW;
+  private _count(state: NetState.HIGH | NetState.LOW, delta: number): void {
+    // Anything that is not HIGH counts as a LOW driver
+    if (state === NetState.HIGH) this.highCount += delta;
+    else this.lowCount += delta;
+  }
+
+  private static _resolve(high: number, low: number): NetState {
+    if (high > 0 && low > 0) return NetState.CONFLICT;
+    if (high > 0) return NetState.HIGH;
+    if (low > 0) return NetState.LOW;
+    return NetState.FLOAT;
   }
 
   /** FLOAT defaults to false (LOW) for component inputs */
   get logicLevel(): boolean {
-    return this.resolvedState === NetState.HIGH;
+    return this.highCount > 0 && this.lowCount === 0;
   }
 }
@@ -0,0 +1,30 @@
+import { Pin } from "./Pin.js";
+import { NetState } from "./types.js";
+
+/** Precompute per-bit driver ids ("<ownerId>:<prefix><i>") so evaluate() never formats strings. */
+export function busDriverIds(ownerId: string, prefix: string, width: number): string[] {
+  return Array.from({ length: width }, (_, i) => `${ownerId}:${prefix}${i}`);
+}
+
+/** Pack the logic levels of a pin group into an integer; bit i comes from pins[i]. */
+export function readBus(pins: readonly Pin[]): number {
+  let value = 0;
+  for (let i = 0; i < pins.length; i++) {
+    if (pins[i]!.logicLevel) value |= 1 << i;
+  }
+  return value;
+}
+
+/** Drive every pin of a group from value; pins[i] gets bit i. */
+export function driveBus(pins: readonly Pin[], ids: readonly string[], value: number): void {
+  for (let i = 0; i < pins.length; i++) {
+    pins[i]!.drive(ids[i]!, (value >> i) & 1 ? NetState.HIGH : NetState.LOW);
+  }
+}
+
+/** Tri-state every pin of a group. */
+export function releaseBus(pins: readonly Pin[], ids: readonly string[]): void {
+  for (let i = 0; i < pins.length; i++) {
+    pins[i]!.unDrive(ids[i]!);
+  }
+}
@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus, releaseBus } from "../bus.js";
 
 /**
  * 28C64 — 8KB (64Kbit) EEPROM, used as ROM (write ignored)
@@ -39,6 +40,8 @@ export class IC28C64 extends Component {
 
   readonly data: Uint8Array;
 
+  private readonly _dIds: string[];
+
   constructor(label?: string, romData?: Uint8Array) {
     const nc1 = new Pin("NC",  PinRole.INPUT);
     const a12 = new Pin("A12", PinRole.INPUT);
@@ -79,6 +82,7 @@ export class IC28C64 extends Component {
 
     this.a = [a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12];
     this.d = [d0, d1, d2, d3, d4, d5, d6, d7];
+    this._dIds = busDriverIds(this.id, "d", 8);
     this.ce = ce; this.oe = oe; this.we = we;
     this.nc1 = nc1; this.nc26 = nc26;
     this.vcc = vcc; this.gnd = gnd;
@@ -92,20 +96,13 @@ export class IC28C64 extends Component {
     const outputEnabled = chipEnabled && !this.oe.logicLevel;
 
     if (outputEnabled) {
-      const byte = this.data[this._addr()] ?? 0;
-      for (let i = 0; i < 8; i++) {
-        this.d[i]!.drive(this.id + `:d${i}`, (byte >> i) & 1 ? NetState.HIGH : NetState.LOW);
-      }
+      driveBus(this.d, this._dIds, this.data[this._addr()] ?? 0);
     } else {
-      for (let i = 0; i < 8; i++) this.d[i]!.unDrive(this.id + `:d${i}`);
+      releaseBus(this.d, this._dIds);
     }
   }
 
   private _addr(): number {
-    let addr = 0;
-    for (let i = 0; i < 13; i++) {
-      if (this.a[i]!.logicLevel) addr |= 1 << i;
-    }
-    return addr;
+    return readBus(this.a);
   }
 }
@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
 import { NetState, PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus } from "../bus.js";
 
 /**
  * CD40193 / 74HC193 — 4-Bit Synchronous Up/Down Binary Counter
@@ -49,6 +50,11 @@ export class IC40193 extends Component {
   private _count = 0;
   private _prevUp = false;
   private _prevDown = false;
+  private readonly _dataPins: Pin[]; // A..D, LSB first
+  private readonly _qPins: Pin[];    // QA..QD, LSB first
+  private readonly _qIds: string[];
+  private readonly _coId: string;
+  private readonly _boId: string;
 
   constructor(label?: string) {
     // Pins created in physical DIP-16 order (pin 1 → pin 16):
@@ -77,6 +83,12 @@ export class IC40193 extends Component {
     this.clr = clr; this.load = load;
     this.co = co; this.bo = bo;
     this.vcc = vcc; this.gnd = gnd;
+
+    this._dataPins = [a, b, c, d];
+    this._qPins = [qa, qb, qc, qd];
+    this._qIds = busDriverIds(this.id, "q", 4);
+    this._coId = this.id + ":co";
+    this._boId = this.id + ":bo";
   }
 
   evaluate(): void {
@@ -91,11 +103,7 @@ export class IC40193 extends Component {
     }
     // Priority 2: async parallel load
     else if (loadLow) {
-      const a = this.a.logicLevel ? 1 : 0;
-      const b = this.b.logicLevel ? 1 : 0;
-      const c = this.c.logicLevel ? 1 : 0;
-      const d = this.d.logicLevel ? 1 : 0;
-      this._count = (d << 3) | (c << 2) | (b << 1) | a;
+      this._count = readBus(this._dataPins);
     }
     // Priority 3: edge-triggered count (only when CLR=LOW and LOAD=HIGH)
     else {
@@ -111,23 +119,17 @@ export class IC40193 extends Component {
     this._prevDown = downHigh;
 
     // Drive Q outputs
-    const drv = (bit: number, id: string, pin: Pin) =>
-      pin.drive(this.id + id, bit ? NetState.HIGH : NetState.LOW);
-
-    drv((this._count >> 0) & 1, ":qa", this.qa);
-    drv((this._count >> 1) & 1, ":qb", this.qb);
-    drv((this._count >> 2) & 1, ":qc", this.qc);
-    drv((this._count >> 3) & 1, ":qd", this.qd);
+    driveBus(this._qPins, this._qIds, this._count);
 
     // CO: active-LOW; pulses LOW when count=15 and UP clock is LOW
     this.co.drive(
-      this.id + ":co",
+      this._coId,
       this._count === 15 && !upHigh ? NetState.LOW : NetState.HIGH
     );
 
     // BO: active-LOW; pulses LOW when count=0 and DOWN clock is LOW
     this.bo.drive(
-      this.id + ":bo",
+      this._boId,
       this._count === 0 && !downHigh ? NetState.LOW : NetState.HIGH
     );
   }
@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus, releaseBus } from "../bus.js";
 
 /**
  * 62256 — 32KB (256Kbit) Static RAM
@@ -36,6 +37,8 @@ export class IC62256 extends Component {
 
   readonly data: Uint8Array;
 
+  private readonly _dIds: string[];
+
   constructor(label?: string, initialData?: Uint8Array) {
     // Create pins in logical groupings for reference
     const a14 = new Pin("A14", PinRole.INPUT);
@@ -78,6 +81,7 @@ export class IC62256 extends Component {
     // Logical A0-A14 order
     this.a = [a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14];
     this.d = [d0, d1, d2, d3, d4, d5, d6, d7];
+    this._dIds = busDriverIds(this.id, "d", 8);
     this.ce = ce; this.oe = oe; this.we = we;
     this.vcc = vcc; this.gnd = gnd;
 
@@ -92,28 +96,17 @@ export class IC62256 extends Component {
 
     if (writeEnabled) {
       // Latch D bus into memory
-      let byte = 0;
-      for (let i = 0; i < 8; i++) {
-        if (this.d[i]!.logicLevel) byte |= 1 << i;
-      }
-      this.data[this._addr()] = byte;
+      this.data[this._addr()] = readBus(this.d);
     }
 
     if (outputEnabled) {
-      const byte = this.data[this._addr()] ?? 0;
-      for (let i = 0; i < 8; i++) {
-        this.d[i]!.drive(this.id + `:d${i}`, (byte >> i) & 1 ? NetState.HIGH : NetState.LOW);
-      }
+      driveBus(this.d, this._dIds, this.data[this._addr()] ?? 0);
     } else {
-      for (let i = 0; i < 8; i++) this.d[i]!.unDrive(this.id + `:d${i}`);
+      releaseBus(this.d, this._dIds);
     }
   }
 
   private _addr(): number {
-    let addr = 0;
-    for (let i = 0; i < 15; i++) {
-      if (this.a[i]!.logicLevel) addr |= 1 << i;
-    }
-    return addr;
+    return readBus(this.a);
   }
 }
@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus, releaseBus } from "../bus.js";
 
 /**
  * 6264 — 8KB (64Kbit) Static RAM
@@ -40,6 +41,8 @@ export class IC6264 extends Component {
 
   readonly data: Uint8Array;
 
+  private readonly _dIds: string[];
+
   constructor(label?: string, initialData?: Uint8Array) {
     const nc  = new Pin("NC",  PinRole.INPUT);
     const a12 = new Pin("A12", PinRole.INPUT);
@@ -80,6 +83,7 @@ export class IC6264 extends Component {
 
     this.a = [a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12];
     this.d = [d0, d1, d2, d3, d4, d5, d6, d7];
+    this._dIds = busDriverIds(this.id, "d", 8);
     this.ce = ce; this.ce2 = ce2; this.oe = oe; this.we = we;
     this.nc = nc; this.vcc = vcc; this.gnd = gnd;
 
@@ -93,28 +97,17 @@ export class IC6264 extends Component {
     const writeEnabled  = chipEnabled && !this.we.logicLevel;
 
     if (writeEnabled) {
-      let byte = 0;
-      for (let i = 0; i < 8; i++) {
-        if (this.d[i]!.logicLevel) byte |= 1 << i;
-      }
-      this.data[this._addr()] = byte;
+      this.data[this._addr()] = readBus(this.d);
     }
 
     if (outputEnabled) {
-      const byte = this.data[this._addr()] ?? 0;
-      for (let i = 0; i < 8; i++) {
-        this.d[i]!.drive(this.id + `:d${i}`, (byte >> i) & 1 ? NetState.HIGH : NetState.LOW);
-      }
+      driveBus(this.d, this._dIds, this.data[this._addr()] ?? 0);
     } else {
-      for (let i = 0; i < 8; i++) this.d[i]!.unDrive(this.id + `:d${i}`);
+      releaseBus(this.d, this._dIds);
     }
   }
 
   private _addr(): number {
-    let addr = 0;
-    for (let i = 0; i < 13; i++) {
-      if (this.a[i]!.logicLevel) addr |= 1 << i;
-    }
-    return addr;
+    return readBus(this.a);
   }
 }
@@ -1,6 +1,12 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus } from "../bus.js";
+
+/** Y0..Y7 output word indexed by enabled (bit 3) and latched address (bits 0-2). */
+const OUTPUT_LUT = Uint8Array.from({ length: 16 }, (_, idx) =>
+  idx & 0b1000 ? ~(1 << (idx & 0b111)) & 0xff : 0xff
+);
 
 /**
  * 74137 / 74HC137 — 3-to-8 Line Decoder / Demultiplexer with Address Latch
@@ -42,6 +48,8 @@ export class IC74137 extends Component {
 
   private _latchedAddr = 0;
   private _prevGl = false; // previous logic level of !GL (false = LOW)
+  private readonly _addrPins: Pin[];
+  private readonly _yIds: string[];
 
   constructor(label?: string) {
     const a   = new Pin("A",   PinRole.INPUT);
@@ -65,8 +73,10 @@ export class IC74137 extends Component {
     super(label ?? "74137", [a, b, c, gl, g2, g1, y7, gnd, y6, y5, y4, y3, y2, y1, y0, vcc]);
 
     this.a = a; this.b = b; this.c = c;
+    this._addrPins = [a, b, c];
     this.gl = gl; this.g2 = g2; this.g1 = g1;
     this.y = [y0, y1, y2, y3, y4, y5, y6, y7];
+    this._yIds = busDriverIds(this.id, "y", 8);
     this.vcc = vcc; this.gnd = gnd;
   }
 
@@ -75,16 +85,10 @@ export class IC74137 extends Component {
 
     if (!glHigh) {
       // !GL=LOW → transparent: latch tracks current address
-      this._latchedAddr =
-        (this.a.logicLevel ? 1 : 0) |
-        (this.b.logicLevel ? 2 : 0) |
-        (this.c.logicLevel ? 4 : 0);
+      this._latchedAddr = readBus(this._addrPins);
     } else if (!this._prevGl) {
       // Rising edge of !GL (LOW→HIGH): latch the current address
-      this._latchedAddr =
-        (this.a.logicLevel ? 1 : 0) |
-        (this.b.logicLevel ? 2 : 0) |
-        (this.c.logicLevel ? 4 : 0);
+      this._latchedAddr = readBus(this._addrPins);
     }
     // else !GL stays HIGH: hold latched address
 
@@ -92,9 +96,6 @@ export class IC74137 extends Component {
 
     const enabled = this.g1.logicLevel && !this.g2.logicLevel;
 
-    for (let i = 0; i < 8; i++) {
-      const state = (enabled && i === this._latchedAddr) ? NetState.LOW : NetState.HIGH;
-      this.y[i]!.drive(this.id + `:y${i}`, state);
-    }
+    driveBus(this.y, this._yIds, OUTPUT_LUT[(enabled ? 0b1000 : 0) | this._latchedAddr]!);
   }
 }
@@ -1,6 +1,14 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus } from "../bus.js";
+
+/** Y0..Y7 output word for every input vector (bit 0..5 = A, B, C, G1, G2A, G2B). */
+const OUTPUT_LUT = Uint8Array.from({ length: 64 }, (_, inputs) => {
+  const addr = inputs & 0b000111;
+  const enabled = (inputs & 0b111000) === 0b001000; // G1=HIGH, G2A=LOW, G2B=LOW
+  return enabled ? ~(1 << addr) & 0xff : 0xff;
+});
 
 /**
  * 74138 / 74HC138 — 3-to-8 Line Decoder / Demultiplexer
@@ -38,6 +46,9 @@ export class IC74138 extends Component {
   readonly vcc: Pin;
   readonly gnd: Pin;
 
+  private readonly _inputPins: Pin[]; // A, B, C, G1, G2A, G2B — LUT index order
+  private readonly _yIds: string[];
+
   constructor(label?: string) {
     const a   = new Pin("A",   PinRole.INPUT);
     const b   = new Pin("B",   PinRole.INPUT);
@@ -61,25 +72,13 @@ export class IC74138 extends Component {
 
     this.a = a; this.b = b; this.c = c;
     this.g1 = g1; this.g2a = g2a; this.g2b = g2b;
+    this._inputPins = [a, b, c, g1, g2a, g2b];
     this.y = [y0, y1, y2, y3, y4, y5, y6, y7];
+    this._yIds = busDriverIds(this.id, "y", 8);
     this.vcc = vcc; this.gnd = gnd;
   }
 
   evaluate(): void {
-    const enabled =
-      this.g1.logicLevel &&
-      !this.g2a.logicLevel &&
-      !this.g2b.logicLevel;
-
-    const addr =
-      (this.a.logicLevel ? 1 : 0) |
-      (this.b.logicLevel ? 2 : 0) |
-      (this.c.logicLevel ? 4 : 0);
-
-    for (let i = 0; i < 8; i++) {
-      // Active-LOW: selected output is LOW, all others HIGH
-      const state = (enabled && i === addr) ? NetState.LOW : NetState.HIGH;
-      this.y[i]!.drive(this.id + `:y${i}`, state);
-    }
+    driveBus(this.y, this._yIds, OUTPUT_LUT[readBus(this._inputPins)]!);
   }
 }
@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus, releaseBus } from "../bus.js";
 
 /**
  * 74HC573 - Octal Transparent D-Type Latch
@@ -21,8 +22,9 @@ export class IC74HC573 extends Component {
   readonly vcc: Pin;
   readonly gnd: Pin;
 
-  private _latch: boolean[] = new Array(8).fill(false);
+  private _latch = 0; // bit i = latched D[i]
   private _prevLe = false;
+  private readonly _qIds: string[];
 
   constructor(label?: string) {
     const oe = new Pin("OE", PinRole.INPUT);
@@ -38,6 +40,7 @@ export class IC74HC573 extends Component {
     this.oe = oe;
     this.d = d;
     this.q = q;
+    this._qIds = busDriverIds(this.id, "q", 8);
     this.le = le;
     this.vcc = vcc;
     this.gnd = gnd;
@@ -50,16 +53,12 @@ export class IC74HC573 extends Component {
 
     // Transparent mode: latch tracks D inputs
     if (leHigh) {
-      for (let i = 0; i < 8; i++) {
-        this._latch[i] = this.d[i]!.logicLevel;
-      }
+      this._latch = readBus(this.d);
     }
 
     // Latch on falling edge of LE (capture current D values)
     if (leFallingEdge) {
-      for (let i = 0; i < 8; i++) {
-        this._latch[i] = this.d[i]!.logicLevel;
-      }
+      this._latch = readBus(this.d);
     }
 
     this._prevLe = leHigh;
@@ -69,17 +68,10 @@ export class IC74HC573 extends Component {
 
     if (!oeActive) {
       // Tri-state all Q outputs
-      for (let i = 0; i < 8; i++) {
-        this.q[i]!.unDrive(this.id + `:q${i}`);
-      }
+      releaseBus(this.q, this._qIds);
     } else {
       // Drive Q outputs from latch
-      for (let i = 0; i < 8; i++) {
-        this.q[i]!.drive(
-          this.id + `:q${i}`,
-          this._latch[i] ? NetState.HIGH : NetState.LOW
-        );
-      }
+      driveBus(this.q, this._qIds, this._latch);
     }
 
     // Also suppress unused edge variables from TypeScript
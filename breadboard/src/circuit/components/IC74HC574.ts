@@ -1,6 +1,7 @@
 import { Component } from "../Component.js";
 import { Pin } from "../Pin.js";
-import { NetState, PinRole } from "../types.js";
+import { PinRole } from "../types.js";
+import { busDriverIds, driveBus, readBus, releaseBus } from "../bus.js";
 
 /**
  * 74HC574 - Octal D-type Flip-Flop with 3-State Outputs (rising-edge triggered)
@@ -27,8 +28,9 @@ export class IC74HC574 extends Component {
   readonly vcc: Pin;
   readonly gnd: Pin;
 
-  private _latch: boolean[] = new Array(8).fill(false);
+  private _latch = 0; // bit i = latched D[i]
   private _prevClk = false;
+  private readonly _qIds: string[];
 
   constructor(label?: string) {
     const oe = new Pin("OE", PinRole.INPUT);
@@ -46,6 +48,7 @@ export class IC74HC574 extends Component {
     this.oe = oe;
     this.d = d;
     this.q = q;
+    this._qIds = busDriverIds(this.id, "q", 8);
     this.clk = clk;
     this.vcc = vcc;
     this.gnd = gnd;
@@ -58,24 +61,15 @@ export class IC74HC574 extends Component {
     // _prevClk is updated immediately so subsequent evaluate() calls
     // within the same propagation step do not re-trigger the edge.
     if (clkHigh && !this._prevClk) {
-      for (let i = 0; i < 8; i++) {
-        this._latch[i] = this.d[i]!.logicLevel;
-      }
+      this._latch = readBus(this.d);
     }
     this._prevClk = clkHigh;
 
     // OE active-LOW: drive Q outputs when OE=LOW, tri-state when OE=HIGH
     if (this.oe.logicLevel) {
-      for (let i = 0; i < 8; i++) {
-        this.q[i]!.unDrive(this.id + `:q${i}`);
-      }
+      releaseBus(this.q, this._qIds);
     } else {
-      for (let i = 0; i < 8; i++) {
-        this.q[i]!.drive(
-          this.id + `:q${i}`,
-          this._latch[i] ? NetState.HIGH : NetState.LOW
-        );
-      }
+      driveBus(this.q, this._qIds, this._latch);
     }
   }
 }
@@ -1,42 +1,78 @@
 import { Circuit } from "../circuit/Circuit.js";
+import { Net } from "../circuit/Net.js";
 import { NetState } from "../circuit/types.js";
 
 const MAX_ITERATIONS = 100;
 
+/** Compact numeric code per NetState, for the packed snapshot buffer. */
+const STATE_CODE: Record<NetState, number> = {
+  [NetState.FLOAT]: 0,
+  [NetState.LOW]: 1,
+  [NetState.HIGH]: 2,
+  [NetState.CONFLICT]: 3,
+};
+
 export class Propagator {
   private readonly circuit: Circuit;
 
+  // Wiring tables, rebuilt only when the circuit's revision changes
+  private compiledRevision = -1;
+  private componentNets: number[][] = []; // component index → indices of the nets on its pins
+  private fanout: number[][] = [];        // net index → indices of components with a pin on it
+
+  // Reused across propagate() calls
+  private states = new Uint8Array(0);
+  private dirty = new Uint8Array(0);
+
   constructor(circuit: Circuit) {
     this.circuit = circuit;
   }
 
-  /** Relaxation loop: evaluate all components until no net state changes. */
+  /**
+   * Relaxation loop: evaluate components until no net state changes.
+   * The first pass evaluates every component (external inputs such as
+   * buttons and clocks may have moved); after that only components
+   * touching a net that changed are re-evaluated.
+   */
   propagate(): void {
-    for (let iter = 0; iter < MAX_ITERATIONS; iter++) {
-      // Snapshot current net states
-      const before = this.circuit.nets.map((n) => n.resolvedState);
+    this._compile();
+    const { components, nets } = this.circuit;
+    const { componentNets, fanout, states, dirty } = this;
 
-      // Evaluate all components
-      for (const comp of this.circuit.components) {
-        comp.evaluate();
-      }
+    // Snapshot current net states
+    for (let i = 0; i < nets.length; i++) {
+      states[i] = STATE_CODE[nets[i]!.resolvedState];
+    }
+    dirty.fill(1);
+    let pending = components.length;
+
+    for (let iter = 0; iter < MAX_ITERATIONS && pending > 0; iter++) {
+      for (let c = 0; c < components.length; c++) {
+        if (!dirty[c]) continue;
+        dirty[c] = 0;
+        pending--;
+        components[c]!.evaluate();
 
-      // Check for stability
-      const after = this.circuit.nets.map((n) => n.resolvedState);
-      let stable = true;
-      for (let i = 0; i < before.length; i++) {
-        if (before[i] !== after[i]) {
-          stable = false;
-          break;
+        // Wake every component on a net this evaluation changed
+        for (const n of componentNets[c]!) {
+          const code = STATE_CODE[nets[n]!.resolvedState];
+          if (states[n] === code) continue;
+          states[n] = code;
+          for (const d of fanout[n]!) {
+            if (!dirty[d]) {
+              dirty[d] = 1;
+              pending++;
+            }
+          }
         }
       }
-
-      if (stable) return;
     }
 
-    console.warn(
-      `Propagator: circuit did not stabilize after ${MAX_ITERATIONS} iterations`
-    );
+    if (pending > 0) {
+      console.warn(
+        `Propagator: circuit did not stabilize after ${MAX_ITERATIONS} iterations`
+      );
+    }
   }
 
   /** Snapshot all net states as a map from net id to NetState. */
@@ -47,4 +83,33 @@ export class Propagator {
     }
     return map;
   }
+
+  /** Build the component↔net tables from the current wiring, if it changed. */
+  private _compile(): void {
+    const { components, nets } = this.circuit;
+    if (
+      this.compiledRevision === this.circuit.revision &&
+      this.dirty.length === components.length &&
+      this.states.length === nets.length
+    ) return;
+
+    const netIndex = new Map<Net, number>();
+    nets.forEach((net, i) => netIndex.set(net, i));
+
+    this.fanout = nets.map(() => []);
+    this.componentNets = components.map((comp, c) => {
+      const indices: number[] = [];
+      for (const pin of comp.pins) {
+        const n = pin.net === null ? undefined : netIndex.get(pin.net);
+        if (n === undefined || indices.includes(n)) continue;
+        indices.push(n);
+        this.fanout[n]!.push(c);
+      }
+      return indices;
+    });
+
+    this.states = new Uint8Array(nets.length);
+    this.dirty = new Uint8Array(components.length);
+    this.compiledRevision = this.circuit.revision;
+  }
 }
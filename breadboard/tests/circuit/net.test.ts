@@ -57,4 +57,26 @@ describe("Net resolution", () => {
     net.unDrive("nonexistent");
     expect(net.resolvedState).toBe(NetState.HIGH);
   });
+
+  it("re-driving with a new state replaces the old contribution", () => {
+    net.drive("a", NetState.HIGH);
+    net.drive("a", NetState.LOW);
+    expect(net.resolvedState).toBe(NetState.LOW);
+    net.unDrive("a");
+    expect(net.resolvedState).toBe(NetState.FLOAT);
+  });
+
+  it("resolvedStateExcluding ignores only the given driver", () => {
+    net.drive("a", NetState.HIGH);
+    net.drive("b", NetState.LOW);
+    expect(net.resolvedStateExcluding("a")).toBe(NetState.LOW);
+    expect(net.resolvedStateExcluding("b")).toBe(NetState.HIGH);
+    expect(net.resolvedStateExcluding("c")).toBe(NetState.CONFLICT);
+    expect(net.resolvedState).toBe(NetState.CONFLICT);
+  });
+
+  it("resolvedStateExcluding the sole driver is FLOAT", () => {
+    net.drive("a", NetState.HIGH);
+    expect(net.resolvedStateExcluding("a")).toBe(NetState.FLOAT);
+  });
 });
@@ -98,4 +98,52 @@ describe("Propagator - battery → resistor → LED → GND", () => {
     propagator.propagate();
     expect(led.lit).toBe(true); // button closed
   });
+
+  it("settles a chain whose components were added against the data flow", () => {
+    const circuit = new Circuit();
+    const battery = new Battery();
+    const r1 = new Resistor();
+    const r2 = new Resistor();
+    const led = new LED("red");
+
+    // Downstream first, so each pass only moves the signal one hop
+    circuit.addComponent(led);
+    circuit.addComponent(r2);
+    circuit.addComponent(r1);
+    circuit.addComponent(battery);
+
+    circuit.connect(battery.vcc, r1.a);
+    circuit.connect(r1.b, r2.a);
+    circuit.connect(r2.b, led.anode);
+    circuit.connect(led.cathode, battery.gnd);
+
+    new Propagator(circuit).propagate();
+    expect(led.lit).toBe(true);
+  });
+
+  it("picks up components wired in after an earlier propagate()", () => {
+    const circuit = new Circuit();
+    const battery = new Battery();
+    const resistor = new Resistor();
+    const led = new LED("red");
+
+    circuit.addComponent(battery);
+    circuit.addComponent(resistor);
+    circuit.addComponent(led);
+    circuit.connect(battery.vcc, resistor.a);
+    circuit.connect(resistor.b, led.anode);
+    circuit.connect(led.cathode, battery.gnd);
+
+    const propagator = new Propagator(circuit);
+    propagator.propagate();
+
+    const second = new LED("green");
+    circuit.addComponent(second);
+    circuit.connect(resistor.b, second.anode);
+    circuit.connect(battery.gnd, second.cathode);
+
+    propagator.propagate();
+    expect(led.lit).toBe(true);
+    expect(second.lit).toBe(true);
+  });
 });